@@ -1,92 +1,196 @@
 from __future__ import annotations
 
-from typing import NamedTuple, TYPE_CHECKING
+from typing import BinaryIO, NamedTuple, TYPE_CHECKING
 from argparse import ArgumentParser
 from pathlib import Path
-from posixpath import normpath, join as posix_join
+from posixpath import normpath, join as posix_join, splitext as posix_splitext
 from string import Template
-from zipfile import ZipFile
+from zipfile import ZipFile, ZipInfo, ZIP_DEFLATED
 from io import BytesIO
 from tomllib import loads as toml_loads
 from json import dumps
+from concurrent.futures import ThreadPoolExecutor
 from http import HTTPStatus
 from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import mimetypes
+import threading
+import tempfile
+import zlib
+import time
+import re
 import sys
 import os
 
 if TYPE_CHECKING:
     from watchdog import events as fsevents
     from watchdog import observers as fsobservers
+    from watchdog.observers import polling as fspolling
 
 try:
     import watchdog
     from watchdog import events as fsevents
     from watchdog import observers as fsobservers
+    from watchdog.observers import polling as fspolling
 except ImportError:
     watchdog = None
 
 
-class _FileField(NamedTuple):
-    content: str
-    path: Path
+class Cfg(NamedTuple):
+    # config.toml flattened into attributes, so hot paths skip the
+    # nested-dict probes.
+    src: str
+    config_dir: str
+    main: str
+    remote_cdn: bool
+    pyscript: str
+    script_type: str
+    out: str
+    compresslevel: int = 6
+    watch_interval: float | None = None
+
+    @classmethod
+    def load(cls, config: Path) -> Cfg:
+        raw = toml_loads(config.read_text())
+        return cls(
+            src=raw["project"]["src"],
+            config_dir=raw["project"]["config"],
+            main=raw["project"]["main"],
+            remote_cdn=raw["runtime"]["remote_cdn"],
+            pyscript=raw["runtime"]["pyscript"],
+            script_type=raw["runtime"]["script_type"],
+            out=raw["build"]["out"],
+            compresslevel=raw["build"].get("compresslevel", 6),
+            watch_interval=raw["build"].get("watch_interval"),
+        )
+
+
+_TEMPLATE_PLACEHOLDER = re.compile(r"\$(?:(\$)|\{\{(\w+)\}\}|(\w+))")
+
+
+def _compile_template(text: str) -> str:
+    # Translate string.Template placeholders into a str.format pattern once,
+    # so each render is plain concatenation instead of a regex scan.
+    text = text.replace("{", "{{").replace("}", "}}")
+    return _TEMPLATE_PLACEHOLDER.sub(
+        lambda m: "$" if m.group(1) else f"{{{m.group(2) or m.group(3)}}}", text
+    )
+
+
+def _build_mime_table() -> dict[str, str]:
+    mimetypes.init()
+    table = {ext: f"{mtype};charset=utf-8" for ext, mtype in mimetypes.types_map.items()}
+    # Overrides for types the system tables miss or misreport.
+    table[".py"] = "text/x-python;charset=utf-8"
+    table[".toml"] = "application/toml;charset=utf-8"
+    table[".mjs"] = "text/javascript;charset=utf-8"
+    table.setdefault(".wasm", "application/wasm;charset=utf-8")
+    return table
+
+
+_MIME_TABLE = _build_mime_table()
+_DEFAULT_MIME = "application/octet-stream;charset=utf-8"
+
+
+def _posix_key(path: Path | str) -> str:
+    # ZIP entry names are POSIX strings; normalize every key the same way.
+    return normpath(str(path).replace("\\", "/"))
+
+
+def _deflate_entry(name: str, data: bytes, compresslevel: int):
+    crc = zlib.crc32(data)
+    # wbits=-15 produces a raw deflate stream, which is what zip stores.
+    obj = zlib.compressobj(compresslevel, zlib.DEFLATED, -15)
+    return name, len(data), crc, obj.compress(data) + obj.flush()
+
+
+def _write_precompressed(zip: ZipFile, name: str, size: int, crc: int, comp: bytes):
+    # Feed an already-deflated payload past ZipFile's serial compressor.
+    # Mirrors what writestr sets up, minus the compression pass.
+    zinfo = ZipInfo(name, time.localtime(time.time())[:6])
+    zinfo.compress_type = ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = size
+    zinfo.compress_size = len(comp)
+    zinfo.CRC = crc
+    zinfo.header_offset = zip.fp.tell()
+    zip.fp.write(zinfo.FileHeader(False))
+    zip.fp.write(comp)
+    zip.start_dir = zip.fp.tell()
+    zip.filelist.append(zinfo)
+    zip.NameToInfo[zinfo.filename] = zinfo
+    zip._didModify = True
+
+
+def _read_bytes(file: Path | str) -> bytes:
+    # One open, one stat, one read - skips the buffered-IO machinery.
+    fd = os.open(file, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        return os.read(fd, size) if size else b""
+    finally:
+        os.close(fd)
 
 
 class ZipBuilder:
     def __init__(self) -> None:
-        self.files: dict[Path, _FileField] = {}
-        self.texts: dict[Path, str] = {}
+        self.entries: dict[str, bytes] = {}
+        self._stat_cache: dict[str, tuple[str, int, int]] = {}
     
-    def add_file(self, file: Path | str, dest: Path | str):
-        file = Path(file)
-
-        if file in self.texts:
-            del self.texts[file]
-
-        with open(file, "r", encoding="utf-8") as buff:
-            self.files[Path(dest)] = _FileField(buff.read(), file)
+    def add_file(self, file: Path | str, dest: str):
+        # Editors often rewrite identical content on save; skip the re-read
+        # when the stat signature matches what we already ingested.
+        st = os.stat(file)
+        sig = (str(file), st.st_mtime_ns, st.st_size)
+        if self._stat_cache.get(dest) == sig:
+            return
+        self._stat_cache[dest] = sig
+        self.insert(dest, _read_bytes(file))
     
-    def add_text(self, text: str, dest: Path | str):
-        file = Path(dest)
-
-        if file in self.files:
-            del self.texts[file]
-        
-        self.texts[file] = text
+    def insert(self, dest: str, content: bytes):
+        # dest must already be a normalized string key.
+        self.entries[dest] = content
     
-    def del_entry(self, path: Path | str):
-        path = Path(path)
-
-        if path in self.files: del self.files[path]
-        if path in self.texts: del self.texts[path]
+    def add_text(self, text: str, dest: str):
+        self.entries[dest] = text.encode("utf-8")
     
-    def get(self, path: Path | str) -> str:
-        path = Path(path)
-        
-        if path in self.files:
-            file = self.files[path]
-            return file.content
-        
-        if path in self.texts:
-            return self.texts[path]
-        
-        raise FileNotFoundError(f"no such file in the ZIP: {path}")
+    def del_entry(self, path: str):
+        self.entries.pop(path, None)
+        self._stat_cache.pop(path, None)
     
-    def has(self, path: Path | str):
-        path = Path(path)
-        return path in self.files or path in self.texts
+    def get(self, path: str) -> bytes:
+        try:
+            return self.entries[path]
+        except KeyError:
+            raise FileNotFoundError(f"no such file in the ZIP: {path}") from None
+    
+    def has(self, path: str):
+        return path in self.entries
 
-    def build_zip(self):
-        buffer = BytesIO()
-        zip = ZipFile(buffer, "w")
+    # Below this many entries the thread pool costs more than it saves.
+    PARALLEL_MIN_ENTRIES = 8
 
-        for path in self.files:
-            zip.writestr(str(path), self.get(path))
-        
-        for path in self.texts:
-            zip.writestr(str(path), self.get(path))
-        
-        zip.close()
+    def build_zip(self, fileobj, compresslevel: int = 6):
+        entries = list(self.entries.items())
+
+        with ZipFile(fileobj, "w", compression=ZIP_DEFLATED, compresslevel=compresslevel) as zip:
+            if len(entries) < self.PARALLEL_MIN_ENTRIES:
+                for path, content in entries:
+                    zip.writestr(path, content)
+                return
+
+            # CRC32 and deflate release the GIL, so precompress entries in
+            # parallel and let the writer just emit headers and bytes.
+            workers = min(32, (os.cpu_count() or 1))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                results = executor.map(
+                    lambda entry: _deflate_entry(*entry, compresslevel), entries
+                )
+                for name, size, crc, comp in results:
+                    _write_precompressed(zip, name, size, crc, comp)
+
+    def build_zip_bytes(self, compresslevel: int = 6) -> bytes:
+        buffer = BytesIO()
+        self.build_zip(buffer, compresslevel)
         try:
             return buffer.getvalue()
         finally:
@@ -99,74 +203,154 @@ INDEX_LOC = "index.html"
 PYSCRIPT_TOML_CFG_TEMPLATE = "pyscript.toml.template"
 PYSCRIPT_JSON_CFG_TEMPLATE = "pyscript.json.template"
 HOST_AT = ("localhost", 8000)
+# Bodies at least this big are spooled to a temp file and served via
+# os.sendfile instead of copying through userspace on every GET.
+SENDFILE_MIN = 256 * 1024
 
 
 class Project:
     def __init__(self, config: Path, zip: ZipBuilder) -> None:
-        self.config = toml_loads(config.read_text())
+        self.cfg = Cfg.load(config)
         self.rel_dir = config.absolute().resolve().parent
         self.zip = zip
-        self.files: list[Path] = []
-        self.pyscript_config = ""
-        self.src_path = Path(self.rel_dir / self.config["project"]["src"]).resolve()
-        self.cfg_dir = Path(self.rel_dir / self.config["project"]["config"]).resolve()
+        self.files: list[str] = []
+        self._src_str = self.cfg.src
+        self._src_prefix = self._src_str if self._src_str.endswith("/") else self._src_str + "/"
+        self.src_path = Path(self.rel_dir / self._src_str).resolve()
+        self.cfg_dir = Path(self.rel_dir / self.cfg.config_dir).resolve()
         self.toml_cfg = (self.cfg_dir / PYSCRIPT_TOML_CFG_TEMPLATE).resolve()
         self.json_cfg = (self.cfg_dir / PYSCRIPT_JSON_CFG_TEMPLATE).resolve()
         self.index_template = (self.cfg_dir / INDEX_TEMPLATE).resolve()
+        self._cfg_dirty = False
+        self._files_hash = 0
+        self._files_index: dict[str, int] = {}
+        self._entries_toml: list[str] = []
+        self._entries_json: list[str] = []
+        self._cfg_cache_key: tuple[int, int] | None = None
+        self._cfg_cache = ""
+        self._response_cache: dict[str, tuple[bytes, bytes, BinaryIO | None]] = {}
+        self._cdn = CDN.substitute(version=self.cfg.pyscript)
+        self._load_cfg_template()
+        self._load_index_template()
+
+    def _load_index_template(self):
+        self._index_fmt = _compile_template(self.index_template.read_text("utf-8"))
+
+    def _load_cfg_template(self):
+        if self.toml_cfg.is_file():
+            self.pyscript_config = "pyscript.toml"
+            self._cfg_is_toml = True
+            self._cfg_fmt = _compile_template(self.toml_cfg.read_text("utf-8"))
+        elif self.json_cfg.is_file():
+            self.pyscript_config = "pyscript.json"
+            self._cfg_is_toml = False
+            self._cfg_fmt = _compile_template(self.json_cfg.read_text("utf-8"))
+        else:
+            raise ValueError("non-existant pyscript config")
+        self._cfg_cache_key = None
     
-    def convert_path(self, path: Path | str):
+    def convert_path(self, path: Path | str) -> str | None:
+        if isinstance(path, str) and path.startswith(self._src_prefix):
+            # Fast path: a relative string under the source prefix.
+            return _posix_key(path[len(self._src_prefix):])
         path = Path(path)
 
         if path.is_absolute():
             if not path.is_relative_to(self.src_path):
-                return
+                return None
             dest_path =  path.relative_to(self.src_path)
-        elif path.is_relative_to(self.config["project"]["src"]):
-            dest_path = path.relative_to(self.config["project"]["src"])
+        elif path.is_relative_to(self._src_str):
+            dest_path = path.relative_to(self._src_str)
         else:
             dest_path = path
-        return dest_path
+        return _posix_key(dest_path)
     
     def _handle_unknwon(self, path: Path | str):
         path = Path(path)
         if path == self.toml_cfg or path == self.json_cfg:
+            self._load_cfg_template()
             self.reload_pyscript_cfg()
         elif path == self.index_template:
+            self._load_index_template()
             self.zip.add_text(self._parse_index_html(), INDEX_LOC)
+            self._response_cache.pop(INDEX_LOC, None)
     
     def reload_pyscript_cfg(self):
         self.zip.add_text(self._parse_pyscript_cfg(), self.pyscript_config)
+        self._response_cache.pop(self.pyscript_config, None)
+        self._cfg_dirty = False
     
     def add_file(self, path: Path | str):
         dest_path = self.convert_path(path)
-        if not dest_path: return self._handle_unknwon(path)
-        
-        if not self.zip.has(dest_path):
-            self.files.append(dest_path)
-            self._parse_pyscript_cfg()
+        if dest_path is None: return self._handle_unknwon(path)
+
+        is_new = not self.zip.has(dest_path)
         self.zip.add_file(path, dest_path)
-    
+        # Track only once the read succeeded, so a failed insert can't leave
+        # a ghost entry behind.
+        if is_new:
+            self._track_file(dest_path)
+        self._response_cache.pop(dest_path, None)
+
     def del_file(self, path: Path | str):
         dest_path = self.convert_path(path)
-        if not dest_path: return
+        if dest_path is None: return
         if not self.zip.has(dest_path): return
-        self.files.remove(dest_path)
+        self._untrack_file(dest_path)
         self.zip.del_entry(dest_path)
-        self._parse_pyscript_cfg()
+        self._response_cache.pop(dest_path, None)
+
+    def _track_file(self, dest_path: str):
+        name = dumps(dest_path)
+        self._files_index[dest_path] = len(self.files)
+        self.files.append(dest_path)
+        self._entries_toml.append(f"{name} = ''")
+        self._entries_json.append(f"{name}: '',")
+        self._files_hash ^= hash(dest_path)
+        self._cfg_dirty = True
+
+    def _untrack_file(self, dest_path: str):
+        # Swap-with-last so removal stays O(1); entry order is not significant.
+        idx = self._files_index.pop(dest_path)
+        last = self.files[-1]
+        for lst in (self.files, self._entries_toml, self._entries_json):
+            lst[idx] = lst[-1]
+            lst.pop()
+        if last != dest_path:
+            self._files_index[last] = idx
+        self._files_hash ^= hash(dest_path)
+        self._cfg_dirty = True
 
     def add_src(self):
-        if not self.config["runtime"]["remote_cdn"]:
+        if not self.cfg.remote_cdn:
             raise NotImplementedError("currently only remote cdn is supported")
-        
-        for pth in self.src_path.rglob("*"):
-            if not pth.is_file(): continue
-            self.add_file(pth)
+
+        paths = list(self._walk(str(self.src_path)))
+        # Reads are independent and release the GIL, so fan them out;
+        # bookkeeping stays on this thread.
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for pth, content in zip(paths, executor.map(_read_bytes, paths)):
+                dest_path = self.convert_path(pth)
+                if dest_path is None: continue
+                if not self.zip.has(dest_path):
+                    self._track_file(dest_path)
+                self.zip.insert(dest_path, content)
+
+    def _walk(self, dirpath: str):
+        # os.scandir reuses the directory entry's type info, unlike
+        # rglob("*") which stats every entry again through is_file().
+        for entry in os.scandir(dirpath):
+            if entry.is_dir(follow_symlinks=False):
+                yield from self._walk(entry.path)
+            elif entry.is_file():
+                yield entry.path
     
     def _gen_file_entry(self, toml: bool):
         if toml:
-            return "\n" + "\n".join([f"{dumps(str(pth))} = ''" for pth in self.files])
+            return "\n" + "\n".join(self._entries_toml)
         # Json format:
-        return "\n" + "\n".join([f"{dumps(str(pth))}: ''," for pth in self.files])
+        return "\n" + "\n".join(self._entries_json)
     
     def _gen_cfg_replace(self, toml: bool):
         return {
@@ -174,30 +358,26 @@ class Project:
         }
     
     def _parse_pyscript_cfg(self):
-        if self.toml_cfg.exists() and self.toml_cfg.is_file():
-            self.pyscript_config = "pyscript.toml"
-            return Template(self.toml_cfg.read_text("utf-8")).substitute(self._gen_cfg_replace(True))
-        elif self.json_cfg.exists() and self.json_cfg.is_file():
-            self.pyscript_config = "pyscipt.json"
-            return Template(self.json_cfg.read_text("utf-8")).substitute(self._gen_cfg_replace(False))
-
-        raise ValueError("non-existant pyscript config")
+        key = (len(self.files), self._files_hash)
+        if key == self._cfg_cache_key:
+            return self._cfg_cache
+        self._cfg_cache = self._cfg_fmt.format_map(self._gen_cfg_replace(self._cfg_is_toml))
+        self._cfg_cache_key = key
+        return self._cfg_cache
     
     def _parse_index_html(self):
-        index_template = self.index_template.read_text("utf-8")
-        return Template(index_template).substitute(
-            {
-                "cdn": CDN.substitute(version=self.config["runtime"]["pyscript"]),
-                "script_type": self.config["runtime"]["script_type"],
-                "main_script": self.config["project"]["main"],
-                "pyscript_config": self.pyscript_config,
-                "extra_script_params": ""
-            }
+        return self._index_fmt.format(
+            cdn=self._cdn,
+            script_type=self.cfg.script_type,
+            main_script=self.cfg.main,
+            pyscript_config=self.pyscript_config,
+            extra_script_params=""
         )
     
     def add_templates(self):
-        self.files.extend((Path(self.pyscript_config), Path(INDEX_LOC)))
-        self.zip.add_text(self._parse_pyscript_cfg(), self.pyscript_config)
+        self._track_file(self.pyscript_config)
+        self._track_file(INDEX_LOC)
+        self.reload_pyscript_cfg()
         self.zip.add_text(self._parse_index_html(), INDEX_LOC)
     
     def serve(self):
@@ -206,7 +386,12 @@ class Project:
             observer = None
         else:
             updater = ProjectUpdater(self)
-            observer = fsobservers.Observer()
+            # Polling is a fallback for filesystems without native events (NFS etc.).
+            interval = self.cfg.watch_interval
+            if interval:
+                observer = fspolling.PollingObserver(timeout=interval)
+            else:
+                observer = fsobservers.Observer()
             observer.schedule(updater, str(self.rel_dir), recursive=True)
             observer.start()
 
@@ -223,62 +408,115 @@ class Project:
                 sys.exit(0)
 
     def write(self):
-        out_path = Path(self.rel_dir / self.config["build"]["out"]).resolve()
+        if self._cfg_dirty:
+            self.reload_pyscript_cfg()
+        out_path = Path(self.rel_dir / self.cfg.out).resolve()
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        out_path.touch()
-        out_path.write_bytes(self.zip.build_zip())
+        with open(out_path, "wb") as buff:
+            self.zip.build_zip(buff, self.cfg.compresslevel)
     
-    def get(self, path: Path | str):
+    def get(self, path: str):
         return self.zip.get(path)
     
-    def has(self, path: Path | str):
+    def has(self, path: str):
         return self.zip.has(path)
+    
+    def get_response(self, path: str) -> tuple[bytes, bytes, BinaryIO | None] | None:
+        if self._cfg_dirty:
+            self.reload_pyscript_cfg()
+        response = self._response_cache.get(path)
+        if response is not None:
+            return response
+        if not self.zip.has(path):
+            return None
+
+        body = self.zip.get(path)
+        mime = _MIME_TABLE.get(posix_splitext(path)[1].lower(), _DEFAULT_MIME)
+        prelude = (
+            f"HTTP/1.1 200 OK\r\n"
+            f"Content-Type: {mime}\r\n"
+            f"Content-Length: {len(body)}\r\n\r\n"
+        ).encode("latin-1")
+
+        spool = None
+        if len(body) >= SENDFILE_MIN and hasattr(os, "sendfile"):
+            spool = tempfile.TemporaryFile()
+            spool.write(body)
+            spool.flush()
+        self._response_cache[path] = response = (prelude, body, spool)
+        return response
 
 
 if watchdog is not None:
     class ProjectUpdater(fsevents.LoggingEventHandler):
+        # Editors tend to emit bursts of events per save (temp file, rename,
+        # touch); coalesce them in a short window and apply each path once.
+        DEBOUNCE_DELAY = 0.1
+
         def __init__(self, project: Project) -> None:
             super().__init__()
             self.project = project
+            self._pending: dict[str, bool] = {} # path -> is a deletion
+            self._lock = threading.Lock()
+            self._timer: threading.Timer | None = None
+
+        def _queue(self, path: str, delete: bool = False):
+            with self._lock:
+                self._pending[path] = delete
+                if self._timer is None:
+                    self._timer = threading.Timer(self.DEBOUNCE_DELAY, self._flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+        def _flush(self):
+            with self._lock:
+                pending, self._pending = self._pending, {}
+                self._timer = None
+            for path, delete in pending.items():
+                try:
+                    if delete:
+                        self.project.del_file(path)
+                    else:
+                        self.project.add_file(path)
+                except OSError:
+                    # The file may be gone again by flush time (editor temp
+                    # files); skip it and keep applying the batch.
+                    continue
+            self.project.reload_pyscript_cfg()
 
         def on_created(self, event: fsevents.DirCreatedEvent | fsevents.FileCreatedEvent) -> None:
             super().on_created(event)
             if isinstance(event, fsevents.DirCreatedEvent): return
-            self.project.add_file(os.fsdecode(event.src_path))
-            self.project.reload_pyscript_cfg()
+            self._queue(os.fsdecode(event.src_path))
         
         def on_modified(self, event: fsevents.DirModifiedEvent | fsevents.FileModifiedEvent) -> None:
             super().on_modified(event)
             if isinstance(event, fsevents.DirModifiedEvent): return
-            self.project.add_file(os.fsdecode(event.src_path))
+            self._queue(os.fsdecode(event.src_path))
         
         def on_deleted(self, event: fsevents.DirDeletedEvent | fsevents.FileDeletedEvent) -> None:
             super().on_deleted(event)
             if isinstance(event, fsevents.DirDeletedEvent): return
-            self.project.del_file(os.fsdecode(event.src_path))
+            self._queue(os.fsdecode(event.src_path), delete=True)
         
         def on_moved(self, event: fsevents.DirMovedEvent | fsevents.FileMovedEvent) -> None:
             super().on_moved(event)
             if isinstance(event, fsevents.DirMovedEvent): return
-            self.project.del_file(os.fsdecode(event.src_path))
-            self.project.add_file(os.fsdecode(event.dest_path))
+            self._queue(os.fsdecode(event.src_path), delete=True)
+            self._queue(os.fsdecode(event.dest_path))
 
 
 class ProjectServer(ThreadingHTTPServer):
     def __init__(self, server_address, bind_and_activate: bool = True, *, project: Project) -> None:
         super().__init__(server_address, ProjectServerHandler, bind_and_activate)
         self.project = project
-    
-    def finish_request(self, request, client_address):
-        ProjectServerHandler(request, client_address, self, project=self.project)
 
 
 class ProjectServerHandler(BaseHTTPRequestHandler):
+    # Content-Length is always sent, so connections can be kept alive.
+    protocol_version = "HTTP/1.1"
     INDEX_PAGES = ("index.html", "index.htm")
-
-    def __init__(self, *args, project: Project | None = None, **kwargs):
-        self.project = project
-        super().__init__(*args, **kwargs)
+    server: ProjectServer
 
     def parse_path(self, pth: str):
         if pth.startswith("/"):
@@ -286,32 +524,36 @@ class ProjectServerHandler(BaseHTTPRequestHandler):
         
         return normpath(pth)
     
-    def guess_mimetype(self, path: str):
-        guess, _ = mimetypes.guess_type(path, False) # guess_file_type for python 3.13
-        if guess: return f"{guess};charset=utf-8"
-        return f"application/octet-stream;charset=utf-8"
-
     def _do_get(self, send_content: bool):
         path = self.parse_path(self.path)
+        project = self.server.project
 
-        if self.project is None:
-            return self.send_error(HTTPStatus.NOT_FOUND, "File not found.")
-
-        if not self.project.has(path):
+        response = project.get_response(path)
+        if response is None:
             for ext in self.INDEX_PAGES:
-                if self.project.has(pth := posix_join(path, ext)):
-                    path = pth
+                if (response := project.get_response(normpath(posix_join(path, ext)))) is not None:
                     break
             else:
                 return self.send_error(HTTPStatus.NOT_FOUND, "File not found.")
         
-        self.send_response(HTTPStatus.OK)
-        self.send_header("Content-type", self.guess_mimetype(path))
-        content = self.project.get(path)
-        self.send_header("Content-Length", str(len(content)))
-        self.end_headers()
-        if send_content:
-            self.wfile.write(content.encode("utf-8"))
+        prelude, body, spool = response
+        self.log_request(HTTPStatus.OK)
+        self.wfile.write(prelude)
+        if not send_content:
+            return
+        if spool is not None:
+            # Kernel-to-kernel copy; flush first so the headers go out ahead
+            # of it. The explicit offset keeps concurrent requests safe.
+            self.wfile.flush()
+            offset, remaining = 0, len(body)
+            while remaining:
+                sent = os.sendfile(self.connection.fileno(), spool.fileno(), offset, remaining)
+                if not sent:
+                    break
+                offset += sent
+                remaining -= sent
+        else:
+            self.wfile.write(body)
     
     def do_GET(self):
         self._do_get(True)